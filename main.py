@@ -1,12 +1,17 @@
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
+import uvicorn
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
+from starlette.applications import Starlette
 
 from ojp.client import get_ojp_client
 from ojp.models import (
-    TripRequestParams, LocationSearchParams
+    TripRequestParams, LocationSearchParams,
+    TripResponse, LocationResponse, TransportMode
 )
 
 # Create an MCP server
@@ -18,15 +23,20 @@ class TripRequestMandatoryParams(BaseModel):
     origin_stop_point_ref: str = Field(..., description="Origin stop point reference")
     destination_stop_point_ref: str = Field(..., description="Destination stop point reference")
 
+@lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized since agents often repeat the same query."""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
 async def _trip_request_internal(
     origin: str,
     destination: str,
     origin_stop_point_ref: str,
     destination_stop_point_ref: str,
     departure_time: Optional[str] = None,
-    transport_modes: List[str] = ["public_transport"],
+    transport_modes: List[TransportMode] = ["public_transport"],
     max_results: int = 5
-) -> dict:
+) -> str:
     """Plan a journey between two locations using Swiss public transport and other modes.
     
     This tool uses the Open Journey Planner (OJP) API to find the best routes between 
@@ -38,90 +48,40 @@ async def _trip_request_internal(
         departure_dt = None
         if departure_time:
             try:
-                departure_dt = datetime.fromisoformat(departure_time.replace('Z', '+00:00'))
+                departure_dt = _parse_iso(departure_time)
             except ValueError:
-                return {
-                    "success": False,
-                    "error": f"Invalid departure time format. Use YYYY-MM-DDTHH:MM:SS format."
-                }
+                return TripResponse.error("Invalid departure time format. Use YYYY-MM-DDTHH:MM:SS format.").tool_json
         
         # Create request parameters
-        params = TripRequestParams(
+        # Arguments are already validated at the MCP tool boundary, so skip re-validation
+        params = TripRequestParams.model_construct(
             origin=origin,
             destination=destination,
             origin_stop_point_ref=origin_stop_point_ref,
             destination_stop_point_ref=destination_stop_point_ref,
             arrival_time=None,  # Not used in this request
             departure_time=departure_dt,
-            transport_modes=transport_modes,
-            max_results=max_results
+            transport_modes=frozenset(transport_modes),
+            max_results=max_results,
+            include_accessibility=False
         )
         
         # Get OJP client and make request
         client = get_ojp_client()
         response = await client.trip_request(params)
         
-        # Convert response to dict for JSON serialization
-        result = {
-            "success": response.success,
-            "timestamp": response.timestamp.isoformat(),
-            "trips": []
-        }
-        
-        if response.error_message:
-            result["error"] = response.error_message
-        
-        for trip in response.trips:
-            trip_dict = {
-                "departure_time": trip.departure_time.isoformat() if trip.departure_time else None,
-                "arrival_time": trip.arrival_time.isoformat() if trip.arrival_time else None,
-                "total_duration_minutes": trip.total_duration_minutes,
-                "transfers": trip.transfers,
-                "legs": []
-            }
-            
-            for leg in trip.legs:
-                leg_dict = {
-                    "mode": leg.mode,
-                    "origin": {
-                        "name": leg.origin.name,
-                        "coordinates": {
-                            "longitude": leg.origin.coordinates.longitude,
-                            "latitude": leg.origin.coordinates.latitude
-                        } if leg.origin.coordinates else None
-                    },
-                    "destination": {
-                        "name": leg.destination.name,
-                        "coordinates": {
-                            "longitude": leg.destination.coordinates.longitude,
-                            "latitude": leg.destination.coordinates.latitude
-                        } if leg.destination.coordinates else None
-                    },
-                    "departure_time_utc": leg.departure_time.isoformat() if leg.departure_time else None,
-                    "arrival_time_utc": leg.arrival_time.isoformat() if leg.arrival_time else None,
-                    "duration_minutes": leg.duration_minutes,
-                    "line_name": leg.line_name,
-                    "direction": leg.direction
-                }
-                trip_dict["legs"].append(leg_dict)
-            
-            result["trips"].append(trip_dict)
-        
-        return result
+        return response.tool_json
         
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }
+        return TripResponse.error(f"Unexpected error: {str(e)}").tool_json
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def trip_request(
     mandatory_params: TripRequestMandatoryParams,
     departure_time: Optional[str] = Field(None, description="Departure time in ISO format (YYYY-MM-DDTHH:MM:SS). If not provided, uses current time."),
-    transport_modes: List[str] = Field(default=["public_transport"], description="Transport modes: public_transport, walking, cycling, car"),
-    max_results: int = Field(default=5, description="Maximum number of trip results to return")
-) -> dict:
+    transport_modes: List[TransportMode] = Field(default=["public_transport"], description="Transport modes: public_transport, walking, cycling, car"),
+    max_results: int = Field(default=5, ge=1, le=20, description="Maximum number of trip results to return")
+) -> str:
     """Plan a journey between two locations using Swiss public transport and other modes.
     
     This tool uses the Open Journey Planner (OJP) API to find the best routes between 
@@ -138,11 +98,11 @@ async def trip_request(
         max_results=max_results
     )
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def location_search(
     query: str = Field(..., description="Search query for locations (station names, addresses, POIs)"),
-    max_results: int = Field(default=10, description="Maximum number of results to return")
-) -> dict:
+    max_results: int = Field(default=10, ge=1, le=50, description="Maximum number of results to return")
+) -> str:
     """Search for locations such as train stations, bus stops, addresses, and points of interest.
     
     This tool helps you find specific locations in Switzerland and neighboring countries.
@@ -155,7 +115,8 @@ async def location_search(
     """
     try:
         # Create request parameters
-        params = LocationSearchParams(
+        # Arguments are already validated at the MCP tool boundary, so skip re-validation
+        params = LocationSearchParams.model_construct(
             query=query,
             coordinates=None,  # Not used in this request
             max_results=max_results
@@ -165,35 +126,35 @@ async def location_search(
         client = get_ojp_client()
         response = await client.location_search(params)
         
-        # Convert response to dict
-        result = {
-            "success": response.success,
-            "timestamp": response.timestamp.isoformat(),
-            "locations": []
-        }
-        
-        if response.error_message:
-            result["error"] = response.error_message
-        
-        for location in response.locations:
-            location_dict = {
-                "stop_point_reference": location.id,
-                "name": location.name,
-                "type": location.type,
-                "coordinates": {
-                    "longitude": location.coordinates.longitude,
-                    "latitude": location.coordinates.latitude
-                } if location.coordinates else None
-            }
-            result["locations"].append(location_dict)
-        
-        return result
+        return response.tool_json
         
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }
+        return LocationResponse.error(f"Unexpected error: {str(e)}").tool_json
+
+def streamable_http_app() -> Starlette:
+    """Build the streamable HTTP app, closing the shared OJP client when the server shuts down.
+    
+    The MCP lifespan runs per session (per request when stateless), so the client is closed
+    from the app lifespan instead to keep its pooled connections alive between calls.
+    """
+    app = mcp.streamable_http_app()
+    session_manager_lifespan = app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_manager_lifespan(app):
+            try:
+                yield
+            finally:
+                await get_ojp_client().aclose()
+    
+    app.router.lifespan_context = lifespan
+    return app
 
 if __name__ == "__main__":
-    mcp.run("streamable-http")
\ No newline at end of file
+    uvicorn.run(
+        streamable_http_app(),
+        host=mcp.settings.host,
+        port=mcp.settings.port,
+        log_level=mcp.settings.log_level.lower()
+    )
\ No newline at end of file
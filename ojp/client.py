@@ -1,27 +1,33 @@
 """OJP API client for making HTTP requests to the Open Journey Planner API."""
 
 import os
+import asyncio
 import httpx
-from typing import Optional
+from typing import Awaitable, Callable, Hashable, Optional
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 from .models import (
     TripRequestParams, LocationSearchParams,
-    TripResponse, LocationResponse
+    OJPResponse, TripResponse, LocationResponse
 )
 from .xml_templates import (
     get_trip_request_xml, get_location_request_xml
 )
 from .parsers import OJPParser
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file, once per process (skipped on module reloads)
+if not os.getenv("OJP_ENV_LOADED"):
+    load_dotenv()
+    os.environ["OJP_ENV_LOADED"] = "1"
 
 # Configuration constants from environment variables
 OJP_V2_ENDPOINT = os.getenv("OJP_V2_ENDPOINT", "https://api.opentransportdata.swiss/ojp20")
 OJP_API_KEY = os.getenv("OJP_API_KEY", "")
 DEFAULT_REQUESTOR_REF = os.getenv("DEFAULT_REQUESTOR_REF", "MCP_OJP_Client_prod")
 DEFAULT_TIMEOUT = int(os.getenv("DEFAULT_TIMEOUT", "30"))
+TRIP_CACHE_TTL = int(os.getenv("TRIP_CACHE_TTL", "30"))
+LOCATION_CACHE_TTL = int(os.getenv("LOCATION_CACHE_TTL", "300"))
 
 
 class OJPClient:
@@ -44,9 +50,91 @@ class OJPClient:
             "Content-Type": "application/xml",
             "Authorization": f"Bearer {self.api_key}"
         }
+        
+        # Shared HTTP/2 client, created lazily so concurrent calls multiplex over pooled connections
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Recent successful responses, keyed by the request parameters that affect the result.
+        # This is the only response cache: TRIP_CACHE_TTL and LOCATION_CACHE_TTL apply here, and
+        # cached responses carry their serialized tool JSON with them (OJPResponse.tool_json).
+        self._trip_cache: TTLCache = TTLCache(maxsize=1024, ttl=TRIP_CACHE_TTL)
+        self._location_cache: TTLCache = TTLCache(maxsize=1024, ttl=LOCATION_CACHE_TTL)
+        # Requests currently in flight, shared by concurrent callers asking the same thing
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30
+                )
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        # Detach first: a request arriving while aclose() awaits gets a fresh client, not this one
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+    
+    async def _cached(
+        self,
+        cache: TTLCache,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[OJPResponse]]
+    ) -> OJPResponse:
+        """Return a cached response for key, or fetch and cache it if successful.
+        
+        Concurrent misses for the same key await the same in-flight request, so only one
+        HTTP call is sent. The request is shielded so a cancelled caller does not abort it
+        for the others.
+        """
+        response = cache.get(key)
+        if response is not None:
+            return response
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish_request(cache, key, done))
+        return await asyncio.shield(future)
+    
+    def _finish_request(self, cache: TTLCache, key: Hashable, future: asyncio.Future) -> None:
+        """Drop a completed request from the in-flight table and cache it if successful."""
+        self._inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        response = future.result()
+        if response.success:
+            cache[key] = response
     
     async def trip_request(self, params: TripRequestParams) -> TripResponse:
         """Request trip planning between origin and destination."""
+        departure_minute = (
+            params.departure_time.replace(second=0, microsecond=0)
+            if params.departure_time else None
+        )
+        key = (
+            "trip",
+            params.origin_stop_point_ref,
+            params.destination_stop_point_ref,
+            departure_minute,
+            params.transport_modes,
+            params.max_results,
+        )
+        return await self._cached(self._trip_cache, key, lambda: self._fetch_trip(params))
+    
+    async def _fetch_trip(self, params: TripRequestParams) -> TripResponse:
+        """Send a trip request to the OJP API and parse the response."""
         try:
             # Generate XML request
             xml_request = get_trip_request_xml(
@@ -61,42 +149,30 @@ class OJPClient:
             )
             
             # Make HTTP request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.endpoint,
-                    content=xml_request,
-                    headers=self.headers
-                )
-                response.raise_for_status()
+            response = await self.http_client.post(self.endpoint, content=xml_request)
+            response.raise_for_status()
             
-            # Parse response
-            return OJPParser.parse_trip_response(response.text)
+            # Parse response in a worker thread so the event loop stays responsive
+            return await asyncio.to_thread(OJPParser.parse_trip_response, response.content)
             
         except httpx.HTTPStatusError as e:
-            return TripResponse(
-                success=False,
-                error_message=f"HTTP error {e.response.status_code}: {e.response.text}"
-            )
+            return TripResponse.error(f"HTTP error {e.response.status_code}: {e.response.text}")
         except httpx.RequestError as e:
-            return TripResponse(
-                success=False,
-                error_message=f"Request error: {str(e)}"
-            )
+            return TripResponse.error(f"Request error: {str(e)}")
         except Exception as e:
-            return TripResponse(
-                success=False,
-                error_message=f"Unexpected error: {str(e)}"
-            )
+            return TripResponse.error(f"Unexpected error: {str(e)}")
     
     async def location_search(self, params: LocationSearchParams) -> LocationResponse:
         """Search for locations (stops, POIs, addresses)."""
+        if not params.query:
+            return LocationResponse.error("Query parameter is required for location search")
+        
+        key = ("location", params.query)
+        return await self._cached(self._location_cache, key, lambda: self._fetch_locations(params))
+    
+    async def _fetch_locations(self, params: LocationSearchParams) -> LocationResponse:
+        """Send a location information request to the OJP API and parse the response."""
         try:
-            if not params.query:
-                return LocationResponse(
-                    success=False,
-                    error_message="Query parameter is required for location search"
-                )
-            
             # Generate XML request
             xml_request = get_location_request_xml(
                 query=params.query,
@@ -104,32 +180,18 @@ class OJPClient:
             )
             
             # Make HTTP request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.endpoint,
-                    content=xml_request,
-                    headers=self.headers
-                )
-                response.raise_for_status()
+            response = await self.http_client.post(self.endpoint, content=xml_request)
+            response.raise_for_status()
             
-            # Parse response
-            return OJPParser.parse_location_response(response.text)
+            # Parse response in a worker thread so the event loop stays responsive
+            return await asyncio.to_thread(OJPParser.parse_location_response, response.content)
             
         except httpx.HTTPStatusError as e:
-            return LocationResponse(
-                success=False,
-                error_message=f"HTTP error {e.response.status_code}: {e.response.text}"
-            )
+            return LocationResponse.error(f"HTTP error {e.response.status_code}: {e.response.text}")
         except httpx.RequestError as e:
-            return LocationResponse(
-                success=False,
-                error_message=f"Request error: {str(e)}"
-            )
+            return LocationResponse.error(f"Request error: {str(e)}")
         except Exception as e:
-            return LocationResponse(
-                success=False,
-                error_message=f"Unexpected error: {str(e)}"
-            )
+            return LocationResponse.error(f"Unexpected error: {str(e)}")
 
 # Global client instance
 _ojp_client: Optional[OJPClient] = None
@@ -1,17 +1,41 @@
 """Pydantic models for OJP requests and responses."""
 
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Literal, Self, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+
+# Transport modes a trip request can ask for
+TransportMode = Literal["public_transport", "walking", "cycling", "car"]
+
+# Last wall-clock time handed out as a response timestamp, and when it was taken
+_last_now: Optional[datetime] = None
+_last_now_ns = 0
+
+
+def _cached_now() -> datetime:
+    """Return the current time, reusing the previous value within the same millisecond."""
+    global _last_now, _last_now_ns
+    now_ns = time.monotonic_ns()
+    if _last_now is None or now_ns - _last_now_ns > 1_000_000:
+        _last_now = datetime.now()
+        _last_now_ns = now_ns
+    return _last_now
+
 
 class Coordinates(BaseModel):
     """Geographic coordinates."""
+    model_config = ConfigDict(frozen=True)
+
     longitude: float = Field(..., ge=-180, le=180)
     latitude: float = Field(..., ge=-90, le=90)
 
 class Location(BaseModel):
     """A location (stop, POI, or address)."""
-    id: Optional[str] = None
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[str] = Field(None, serialization_alias="stop_point_reference")
     name: str
     coordinates: Optional[Coordinates] = None
     type: Literal["stop", "poi", "address"] = "stop"
@@ -25,7 +49,7 @@ class TripRequestParams(BaseModel):
     destination_stop_point_ref: str = Field(..., description="Destination stop point reference")
     departure_time: Optional[datetime] = Field(None, description="Preferred departure time. UTC")
     arrival_time: Optional[datetime] = Field(None, description="Preferred arrival time. UTC")
-    transport_modes: List[str] = Field(default=["public_transport"], description="Transport modes to use")
+    transport_modes: frozenset[TransportMode] = Field(default=frozenset({"public_transport"}), description="Transport modes to use")
     max_results: int = Field(default=5, ge=1, le=20)
     include_accessibility: bool = Field(default=False, description="Include accessibility information")
 
@@ -39,11 +63,13 @@ class LocationSearchParams(BaseModel):
 
 class Leg(BaseModel):
     """A journey leg."""
+    model_config = ConfigDict(frozen=True)
+
     mode: str
     origin: Location
     destination: Location
-    departure_time: Optional[datetime] = None
-    arrival_time: Optional[datetime] = None
+    departure_time: Optional[datetime] = Field(None, serialization_alias="departure_time_utc")
+    arrival_time: Optional[datetime] = Field(None, serialization_alias="arrival_time_utc")
     duration_minutes: Optional[int] = None
     distance_meters: Optional[int] = None
     line_name: Optional[str] = None
@@ -51,7 +77,9 @@ class Leg(BaseModel):
 
 class Trip(BaseModel):
     """A complete trip with multiple legs."""
-    legs: List[Leg]
+    model_config = ConfigDict(frozen=True)
+
+    legs: Tuple[Leg, ...]
     total_duration_minutes: int
     total_distance_meters: Optional[int] = None
     departure_time: datetime
@@ -61,16 +89,32 @@ class Trip(BaseModel):
 
 class OJPResponse(BaseModel):
     """Base OJP response."""
+    model_config = ConfigDict(frozen=True)
+
     success: bool
-    error_message: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    error_message: Optional[str] = Field(None, serialization_alias="error")
+    timestamp: datetime = Field(default_factory=_cached_now)
+
+    @classmethod
+    def error(cls, error_message: str) -> Self:
+        """Build a failed response, skipping validation of the trusted fields."""
+        return cls.model_construct(success=False, error_message=error_message)
+
+    @cached_property
+    def tool_json(self) -> str:
+        """JSON text returned by the MCP tools, serialized once per response.
+        
+        Aliases map model fields to the tool output keys and empty fields are left out.
+        Responses are frozen, so a response served from the client's cache reuses its text.
+        """
+        return self.model_dump_json(by_alias=True, exclude_none=True)
 
 
 class TripResponse(OJPResponse):
     """Response for trip requests."""
-    trips: List[Trip] = Field(default_factory=list)
+    trips: Tuple[Trip, ...] = ()
 
 
 class LocationResponse(OJPResponse):
     """Response for location searches."""
-    locations: List[Location] = Field(default_factory=list)
\ No newline at end of file
+    locations: Tuple[Location, ...] = ()
\ No newline at end of file
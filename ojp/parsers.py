@@ -1,7 +1,11 @@
 """XML response parsers for OJP responses."""
 
+import re
+import sys
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from io import BytesIO
+from typing import Iterator, List, Optional, Union
 from lxml import etree # pyright: ignore[reportAttributeAccessIssue]
 from dateutil import parser as date_parser
 
@@ -10,54 +14,248 @@ from .models import (
     TripResponse, LocationResponse
 )
 
+_OJP_NS = 'http://www.vdv.de/ojp'
+_SIRI_NS = 'http://www.siri.org.uk/siri'
+
+# Plain dict so callers can pass it straight to lxml; compiled XPaths keep their own copy
+NAMESPACES = {
+    'siri': _SIRI_NS,
+    'ojp': _OJP_NS
+}
+
+# Time-only ISO 8601 duration; seconds are accepted but dropped when converting to minutes
+_ISO_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:\d+(?:\.\d+)?S)?")
+
+# Clark-notation tags for direct child lookups, which bypass XPath entirely
+_OJP = f"{{{_OJP_NS}}}"
+_SIRI = f"{{{_SIRI_NS}}}"
+_TAG_TRIP_RESULT = f"{_OJP}TripResult"
+_TAG_PLACE_RESULT = f"{_OJP}PlaceResult"
+_TAG_STATUS = f"{_SIRI}Status"
+_TAG_ERROR_CONDITION = f"{_SIRI}ErrorCondition"
+_TAG_TRANSFER_LEG = f"{_OJP}TransferLeg"
+_TAG_LEG_BOARD = f"{_OJP}LegBoard"
+_TAG_LEG_ALIGHT = f"{_OJP}LegAlight"
+_TAG_LEG_START = f"{_OJP}LegStart"
+_TAG_LEG_END = f"{_OJP}LegEnd"
+_TAG_SERVICE = f"{_OJP}Service"
+_TAG_PUBLIC_CODE = f"{_OJP}PublicCode"
+_TAG_TRANSFER_TYPE = f"{_OJP}TransferType"
+_TAG_DURATION = f"{_OJP}Duration"
+_TAG_SERVICE_DEPARTURE = f"{_OJP}ServiceDeparture"
+_TAG_SERVICE_ARRIVAL = f"{_OJP}ServiceArrival"
+_TAG_ESTIMATED_TIME = f"{_OJP}EstimatedTime"
+_TAG_TIMETABLED_TIME = f"{_OJP}TimetabledTime"
+_TAG_PLACE = f"{_OJP}Place"
+_TAG_PROBABILITY = f"{_OJP}Probability"
+_TAG_GEO_POSITION = f"{_OJP}GeoPosition"
+_TAG_OJP_LONGITUDE = f"{_OJP}Longitude"
+_TAG_OJP_LATITUDE = f"{_OJP}Latitude"
+_TAG_SIRI_LONGITUDE = f"{_SIRI}Longitude"
+_TAG_SIRI_LATITUDE = f"{_SIRI}Latitude"
+_TAG_STOP_POINT_REF = f"{_SIRI}StopPointRef"
+
+# OJP responses need no entity expansion, xml:id table or network access; disabling them
+# saves per-parse work and keeps the parser safe from external entity tricks
+_PARSER_OPTIONS = dict(collect_ids=False, resolve_entities=False, no_network=True)
+
+# Errors a malformed element can raise while being read into a model (pydantic's
+# ValidationError is a ValueError); a helper hitting one skips or defaults that element
+_PARSE_ERRORS = (ValueError, TypeError, AttributeError, IndexError)
+# Errors that make a whole response unusable, including XML syntax errors
+_RESPONSE_ERRORS = (etree.LxmlError,) + _PARSE_ERRORS
+
+# Locations are frozen, so one placeholder can stand in wherever a name is missing
+_UNKNOWN_LOCATION = Location(name="Unknown")
+
+
+def _interned(text: Optional[str]) -> Optional[str]:
+    """Intern stop names and refs, which repeat across the legs of every trip, so each is stored once."""
+    return sys.intern(text) if text else text
+
+
+def _as_bytes(xml_content: Union[bytes, str]) -> bytes:
+    """Return the raw XML bytes, encoding only when given text."""
+    if isinstance(xml_content, (bytes, bytearray)):
+        return xml_content
+    return xml_content.encode('utf-8')
+
+
+class _ServiceError(Exception):
+    """The OJP service answered with a failed status instead of results."""
+
+
+def _error_description(condition) -> str:
+    """Describe a siri:ErrorCondition by its text (Description, ErrorText), or else by its error type."""
+    text = " ".join(part.strip() for part in condition.itertext() if part.strip())
+    if text:
+        return text
+    return etree.QName(condition[0]).localname if len(condition) else "unknown error"
+
+
+class _DeliveryStatus:
+    """Track a delivery's Status and ErrorCondition elements, in document order.
+    
+    An ErrorCondition only fails the request after a false Status; under a true
+    Status it is a warning and the results are still returned.
+    """
+    
+    def __init__(self):
+        self.failed = False
+    
+    def update(self, elem) -> None:
+        """Record a Status element, or raise _ServiceError for an ErrorCondition of a failed request."""
+        if elem.tag == _TAG_ERROR_CONDITION:
+            if self.failed:
+                raise _ServiceError(_error_description(elem))
+        elif (elem.text or "").strip() in ("false", "0"):
+            self.failed = True
+    
+    def finish(self) -> None:
+        """Raise _ServiceError for a failed request that carried no ErrorCondition."""
+        if self.failed:
+            raise _ServiceError("request failed without an error description")
+
+
+def _iter_results(xml_content: Union[bytes, str], result_tag: str) -> Iterator:
+    """Stream the result elements of a response so only one is held in memory at a time.
+    
+    The delivery's Status and ErrorCondition arrive before any results, so a failed
+    request raises _ServiceError without walking the rest of the payload.
+    """
+    status = _DeliveryStatus()
+    events = etree.iterparse(
+        BytesIO(_as_bytes(xml_content)),
+        events=('end',),
+        **_PARSER_OPTIONS,
+        tag=(result_tag, _TAG_STATUS, _TAG_ERROR_CONDITION)
+    )
+    
+    for _, elem in events:
+        if elem.tag == result_tag:
+            yield elem
+            
+            # Free the parsed result and everything before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        else:
+            status.update(elem)
+    
+    status.finish()
+
+
+def _parse_results(xml_content: Union[bytes, str], result_tag: str) -> List:
+    """Parse a whole response and return its result elements.
+    
+    Location responses are small, so building the tree in one go costs less CPU than
+    streaming it with iterparse. Raises _ServiceError for a failed request.
+    """
+    # lxml parsers must not be shared between threads, and one costs under a microsecond
+    root = etree.fromstring(_as_bytes(xml_content), etree.XMLParser(**_PARSER_OPTIONS))
+    
+    status = _DeliveryStatus()
+    for elem in root.iter(_TAG_STATUS, _TAG_ERROR_CONDITION):
+        status.update(elem)
+    status.finish()
+    
+    return list(root.iter(result_tag))
+
+
+def _child(elem, tag: str):
+    """Return the first direct child of elem with the given Clark-notation tag, or None."""
+    return next(elem.iterchildren(tag), None)
+
+
+@lru_cache(maxsize=128)
+def _xp(expr: str) -> etree.XPath:
+    """Compile an XPath expression against the OJP namespaces, reusing earlier compilations."""
+    return etree.XPath(expr, namespaces=NAMESPACES)
+
+
+# XPath expressions compiled once at import; calling them avoids re-parsing the expression per lookup
+_XP_TRIP_LEG = _xp('./ojp:Trip/ojp:Leg')
+_XP_LEG_KIND = _xp('./ojp:TimedLeg | ./ojp:ContinuousLeg | ./ojp:TransferLeg')
+_XP_PUBLISHED_SERVICE_NAME_TEXT = _xp('./ojp:PublishedServiceName/ojp:Text')
+_XP_DESTINATION_TEXT_TEXT = _xp('./ojp:DestinationText/ojp:Text')
+_XP_MODE_PT_MODE = _xp('./ojp:Mode/ojp:PtMode')
+_XP_MODE_RAIL_SUBMODE = _xp('./ojp:Mode/siri:RailSubmode')
+_XP_MODE_BUS_SUBMODE = _xp('./ojp:Mode/siri:BusSubmode')
+
+# Canonical mode names for OJP PtMode values (lower-cased) and rail/bus submodes
+_SIMPLE_MODE_MAP = {
+    "tram": "tram",
+    "metro": "metro",
+    "funicular": "funicular",
+    "cablecar": "cable_car",
+}
+_RAIL_SUBMODE_MAP = {
+    "regionalRail": "regional_train",
+    "suburbanRailway": "s_bahn",
+    "interregionalRail": "intercity",
+    "highSpeedRail": "high_speed_rail",
+}
+_BUS_SUBMODE_MAP = {
+    "localBus": "bus",
+    "expressBus": "express_bus",
+    "nightBus": "night_bus",
+}
+# Leg modes that do not count towards a trip's transfers
+_WALK_MODES = frozenset({"walk", "walking"})
+# PtMode -> (submode XPath, submode map, mode for unknown submodes)
+_PT_SUBMODE_LOOKUPS = {
+    "rail": (_XP_MODE_RAIL_SUBMODE, _RAIL_SUBMODE_MAP, "train"),
+    "bus": (_XP_MODE_BUS_SUBMODE, _BUS_SUBMODE_MAP, "bus"),
+}
+
+_XP_N_TEXT = _xp('./ojp:n/ojp:Text')
+_XP_STOP_POINT_NAME_TEXT = _xp('./ojp:StopPointName/ojp:Text')
+_XP_LOCATION_NAME_TEXT = _xp('./ojp:LocationName/ojp:Text')
+_XP_NAME_TEXT = _xp('./ojp:Name/ojp:Text')
+_XP_STOP_PLACE_STOP_PLACE_NAME_TEXT = _xp('./ojp:StopPlace/ojp:StopPlaceName/ojp:Text')
+_XP_STOP_PLACE_STOP_PLACE_REF = _xp('./ojp:StopPlace/ojp:StopPlaceRef')
+
 
 class OJPParser:
     """Parser for OJP XML responses."""
     
-    NAMESPACES = {
-        'siri': 'http://www.siri.org.uk/siri',
-        'ojp': 'http://www.vdv.de/ojp'
-    }
+    NAMESPACES = NAMESPACES
     
     @classmethod
-    def parse_trip_response(cls, xml_content: str) -> TripResponse:
+    def parse_trip_response(cls, xml_content: Union[bytes, str]) -> TripResponse:
         """Parse trip response XML."""
         try:
-            root = etree.fromstring(xml_content.encode('utf-8'))
             trips = []
             
-            # Find all trip results
-            trip_results = root.xpath('//ojp:TripResult', namespaces=cls.NAMESPACES)
-            
-            for trip_result in trip_results:
+            for trip_result in _iter_results(xml_content, _TAG_TRIP_RESULT):
                 trip = cls._parse_trip(trip_result)
                 if trip:
                     trips.append(trip)
             
-            return TripResponse(success=True, trips=trips)
+            return TripResponse.model_construct(success=True, trips=tuple(trips))
             
-        except Exception as e:
-            return TripResponse(success=False, error_message=f"Failed to parse trip response: {str(e)}")
+        except _ServiceError as e:
+            return TripResponse.error(f"OJP service error: {e}")
+        except _RESPONSE_ERRORS as e:
+            return TripResponse.error(f"Failed to parse trip response: {str(e)}")
     
     @classmethod
-    def parse_location_response(cls, xml_content: str) -> LocationResponse:
+    def parse_location_response(cls, xml_content: Union[bytes, str]) -> LocationResponse:
         """Parse location information response XML."""
         try:
-            root = etree.fromstring(xml_content.encode('utf-8'))
             locations = []
             
-            # Find all place results in location information response
-            place_results = root.xpath('//ojp:PlaceResult', namespaces=cls.NAMESPACES)
-            
-            for place_result in place_results:
+            for place_result in _parse_results(xml_content, _TAG_PLACE_RESULT):
                 location = cls._parse_place_result(place_result)
                 if location:
                     locations.append(location)
             
-            return LocationResponse(success=True, locations=locations)
+            return LocationResponse.model_construct(success=True, locations=tuple(locations))
             
-        except Exception as e:
-            return LocationResponse(success=False, error_message=f"Failed to parse location response: {str(e)}")
+        except _ServiceError as e:
+            return LocationResponse.error(f"OJP service error: {e}")
+        except _RESPONSE_ERRORS as e:
+            return LocationResponse.error(f"Failed to parse location response: {str(e)}")
     
     @classmethod
     def _parse_trip(cls, trip_elem) -> Optional[Trip]:
@@ -65,55 +263,42 @@ class OJPParser:
         try:
             legs = []
             
-            # Parse legs
-            leg_elements = trip_elem.xpath('.//ojp:Leg', namespaces=cls.NAMESPACES)
-            for leg_elem in leg_elements:
-                leg = cls._parse_leg(leg_elem)
-                if leg:
-                    legs.append(leg)
-            
-            if not legs:
-                return None
-            
-            # Calculate trip totals
-            # Find first leg with departure time (may not be the first leg if it starts with walking)
+            # Parse legs and gather trip totals in a single pass
+            # The first departure and last arrival may not be on the first/last leg if it is a walk
             departure_time = None
-            for leg in legs:
-                if leg.departure_time:
-                    departure_time = leg.departure_time
-                    break
-            
-            # Find last leg with arrival time (may not be the last leg if it ends with walking)
             arrival_time = None
-            for leg in reversed(legs):
+            legs_duration = 0
+            public_transport_legs = 0
+            for leg_elem in _XP_TRIP_LEG(trip_elem):
+                leg = cls._parse_leg(leg_elem)
+                if not leg:
+                    continue
+                legs.append(leg)
+                
+                if leg.departure_time and not departure_time:
+                    departure_time = leg.departure_time
                 if leg.arrival_time:
                     arrival_time = leg.arrival_time
-                    break
+                
+                if leg.duration_minutes:
+                    legs_duration += leg.duration_minutes
+                elif leg.departure_time and leg.arrival_time:
+                    legs_duration += int((leg.arrival_time - leg.departure_time).total_seconds() / 60)
+                
+                if leg.mode not in _WALK_MODES:
+                    public_transport_legs += 1
+            
+            if not legs:
+                return None
             
-            # Calculate duration
-            total_duration = 0
+            # Calculate duration, falling back to the sum of individual leg durations
             if departure_time and arrival_time:
                 total_duration = int((arrival_time - departure_time).total_seconds() / 60)
             else:
-                # Fallback: sum individual leg durations
-                for leg in legs:
-                    if leg.duration_minutes:
-                        total_duration += leg.duration_minutes
-                    elif leg.departure_time and leg.arrival_time:
-                        leg_duration = int((leg.arrival_time - leg.departure_time).total_seconds() / 60)
-                        total_duration += leg_duration
+                total_duration = legs_duration
             
             # Count transfers (number of public transport legs - 1)
-            public_transport_legs = [leg for leg in legs if leg.mode not in ['walk', 'walking']]
-            transfers = max(0, len(public_transport_legs) - 1)
-            
-            # Use first leg's departure time if no timed leg found
-            if not departure_time:
-                departure_time = legs[0].departure_time
-            
-            # Use last leg's arrival time if no timed leg found  
-            if not arrival_time:
-                arrival_time = legs[-1].arrival_time
+            transfers = max(0, public_transport_legs - 1)
             
             return Trip(
                 legs=legs,
@@ -123,135 +308,83 @@ class OJPParser:
                 transfers=transfers
             )
             
-        except Exception:
+        except _PARSE_ERRORS:
             return None
     
     @classmethod
     def _parse_leg(cls, leg_elem) -> Optional[Leg]:
         """Parse a single leg element."""
-        try:
-            # Determine leg type and mode
-            timed_leg = leg_elem.xpath('.//ojp:TimedLeg', namespaces=cls.NAMESPACES)
-            continuous_leg = leg_elem.xpath('.//ojp:ContinuousLeg', namespaces=cls.NAMESPACES)
-            transfer_leg = leg_elem.xpath('./ojp:TransferLeg', namespaces=cls.NAMESPACES)
-            
-            if timed_leg:
-                return cls._parse_timed_leg(timed_leg[0])
-            elif continuous_leg:
-                return cls._parse_continuous_leg(continuous_leg[0])
-            elif transfer_leg:
-                return cls._parse_transfer_leg(leg_elem, transfer_leg[0])
-            
-            return None
-            
-        except Exception:
+        # Determine leg type with a single lookup and dispatch on its tag
+        # (each leg parser handles its own malformed input)
+        leg_kind = _XP_LEG_KIND(leg_elem)
+        if not leg_kind:
             return None
+        
+        kind_elem = leg_kind[0]
+        kind = etree.QName(kind_elem).localname
+        if kind == "TimedLeg":
+            return cls._parse_timed_leg(kind_elem)
+        elif kind == "ContinuousLeg":
+            return cls._parse_continuous_leg(kind_elem)
+        else:
+            return cls._parse_transfer_leg(leg_elem, kind_elem)
     
     @classmethod
     def _parse_timed_leg(cls, leg_elem) -> Optional[Leg]:
         """Parse a timed leg (public transport)."""
         try:
             # Get boarding and alighting information
-            board_elem = leg_elem.xpath('.//ojp:LegBoard', namespaces=cls.NAMESPACES)
-            alight_elem = leg_elem.xpath('.//ojp:LegAlight', namespaces=cls.NAMESPACES)
+            board_elem = _child(leg_elem, _TAG_LEG_BOARD)
+            alight_elem = _child(leg_elem, _TAG_LEG_ALIGHT)
             
-            if not board_elem or not alight_elem:
+            if board_elem is None or alight_elem is None:
                 return None
             
             # Get origin and destination locations
-            origin = cls._parse_leg_board_alight(board_elem[0])
-            destination = cls._parse_leg_board_alight(alight_elem[0])
+            origin = cls._parse_leg_board_alight(board_elem)
+            destination = cls._parse_leg_board_alight(alight_elem)
             
-            # Get departure and arrival times
-            departure_time = None
-            arrival_time = None
-            
-            # Extract departure time from ServiceDeparture
-            dep_time_elem = board_elem[0].xpath('.//ojp:ServiceDeparture/ojp:EstimatedTime', namespaces=cls.NAMESPACES)
-            if not dep_time_elem:
-                dep_time_elem = board_elem[0].xpath('.//ojp:ServiceDeparture/ojp:TimetabledTime', namespaces=cls.NAMESPACES)
-            if dep_time_elem:
-                try:
-                    departure_time = date_parser.parse(dep_time_elem[0].text)
-                except Exception:
-                    pass
-            
-            # Extract arrival time from ServiceArrival
-            arr_time_elem = alight_elem[0].xpath('.//ojp:ServiceArrival/ojp:EstimatedTime', namespaces=cls.NAMESPACES)
-            if not arr_time_elem:
-                arr_time_elem = alight_elem[0].xpath('.//ojp:ServiceArrival/ojp:TimetabledTime', namespaces=cls.NAMESPACES)
-            if arr_time_elem:
-                try:
-                    arrival_time = date_parser.parse(arr_time_elem[0].text)
-                except Exception:
-                    pass
+            # Get departure and arrival times from ServiceDeparture and ServiceArrival
+            departure_time = cls._parse_service_time(_child(board_elem, _TAG_SERVICE_DEPARTURE))
+            arrival_time = cls._parse_service_time(_child(alight_elem, _TAG_SERVICE_ARRIVAL))
             
             # Get service info and transport mode
-            service = leg_elem.xpath('.//ojp:Service', namespaces=cls.NAMESPACES)
+            service = _child(leg_elem, _TAG_SERVICE)
             line_name = None
             direction = None
             mode = "public_transport"  # default fallback
             
-            if service:
+            if service is not None:
                 # Try PublishedServiceName first (e.g., "S4", "200")
-                line_elem = service[0].xpath('.//ojp:PublishedServiceName/ojp:Text', namespaces=cls.NAMESPACES)
+                line_elem = _XP_PUBLISHED_SERVICE_NAME_TEXT(service)
                 if line_elem:
                     line_name = line_elem[0].text
                 
                 # Fallback to PublicCode if no PublishedServiceName
                 if not line_name:
-                    code_elem = service[0].xpath('.//ojp:PublicCode', namespaces=cls.NAMESPACES)
-                    if code_elem:
-                        line_name = code_elem[0].text
+                    code_elem = _child(service, _TAG_PUBLIC_CODE)
+                    if code_elem is not None:
+                        line_name = code_elem.text
                 
-                direction_elem = service[0].xpath('.//ojp:DestinationText/ojp:Text', namespaces=cls.NAMESPACES)
+                direction_elem = _XP_DESTINATION_TEXT_TEXT(service)
                 if direction_elem:
                     direction = direction_elem[0].text
                 
                 # Extract transport mode from Mode/PtMode
-                mode_elem = service[0].xpath('.//ojp:Mode/ojp:PtMode', namespaces=cls.NAMESPACES)
+                mode_elem = _XP_MODE_PT_MODE(service)
                 if mode_elem:
                     pt_mode = mode_elem[0].text
                     if pt_mode:
-                        mode = pt_mode.lower()
+                        pt_mode = pt_mode.lower()
+                        mode = _SIMPLE_MODE_MAP.get(pt_mode, pt_mode)
                         
-                        # Get submode for more specific transport type
-                        if pt_mode.lower() == "rail":
-                            rail_submode_elem = service[0].xpath('.//ojp:Mode/siri:RailSubmode', namespaces=cls.NAMESPACES)
-                            if rail_submode_elem and rail_submode_elem[0].text:
-                                submode = rail_submode_elem[0].text
-                                # Map common rail submodes to more readable names
-                                if submode == "regionalRail":
-                                    mode = "regional_train"
-                                elif submode == "suburbanRailway":
-                                    mode = "s_bahn"
-                                elif submode == "interregionalRail":
-                                    mode = "intercity"
-                                elif submode == "highSpeedRail":
-                                    mode = "high_speed_rail"
-                                else:
-                                    mode = "train"
-                        elif pt_mode.lower() == "bus":
-                            bus_submode_elem = service[0].xpath('.//ojp:Mode/siri:BusSubmode', namespaces=cls.NAMESPACES)
-                            if bus_submode_elem and bus_submode_elem[0].text:
-                                submode = bus_submode_elem[0].text
-                                # Map common bus submodes
-                                if submode == "localBus":
-                                    mode = "bus"
-                                elif submode == "expressBus":
-                                    mode = "express_bus"
-                                elif submode == "nightBus":
-                                    mode = "night_bus"
-                                else:
-                                    mode = "bus"
-                        elif pt_mode.lower() == "tram":
-                            mode = "tram"
-                        elif pt_mode.lower() == "metro":
-                            mode = "metro"
-                        elif pt_mode.lower() == "funicular":
-                            mode = "funicular"
-                        elif pt_mode.lower() == "cableCar":
-                            mode = "cable_car"
+                        # Get submode for more specific transport type (rail and bus only)
+                        submode_lookup = _PT_SUBMODE_LOOKUPS.get(pt_mode)
+                        if submode_lookup:
+                            submode_xpath, submode_map, default_mode = submode_lookup
+                            submode_elem = submode_xpath(service)
+                            if submode_elem and submode_elem[0].text:
+                                mode = submode_map.get(submode_elem[0].text, default_mode)
             
             return Leg(
                 mode=mode,
@@ -263,7 +396,7 @@ class OJPParser:
                 direction=direction
             )
             
-        except Exception:
+        except _PARSE_ERRORS:
             return None
     
     @classmethod
@@ -271,44 +404,44 @@ class OJPParser:
         """Parse a continuous leg (walking, cycling, etc.)."""
         try:
             # Get origin and destination from TransferLeg
-            transfer_leg = leg_elem.xpath('.//ojp:TransferLeg', namespaces=cls.NAMESPACES)
-            if not transfer_leg:
+            transfer_leg = _child(leg_elem, _TAG_TRANSFER_LEG)
+            if transfer_leg is None:
                 return None
             
-            origin_elem = transfer_leg[0].xpath('.//ojp:LegStart', namespaces=cls.NAMESPACES)
-            destination_elem = transfer_leg[0].xpath('.//ojp:LegEnd', namespaces=cls.NAMESPACES)
+            origin_elem = _child(transfer_leg, _TAG_LEG_START)
+            destination_elem = _child(transfer_leg, _TAG_LEG_END)
             
-            origin = cls._parse_transfer_location(origin_elem[0]) if origin_elem else None
-            destination = cls._parse_transfer_location(destination_elem[0]) if destination_elem else None
+            origin = cls._parse_transfer_location(origin_elem) if origin_elem is not None else None
+            destination = cls._parse_transfer_location(destination_elem) if destination_elem is not None else None
             
             # Get transfer type (walk, cycle, etc.)
-            transfer_type_elem = transfer_leg[0].xpath('.//ojp:TransferType', namespaces=cls.NAMESPACES)
+            transfer_type_elem = _child(transfer_leg, _TAG_TRANSFER_TYPE)
             mode = "walking"  # default
-            if transfer_type_elem:
-                mode_text = transfer_type_elem[0].text
+            if transfer_type_elem is not None:
+                mode_text = transfer_type_elem.text
                 if mode_text:
                     mode = mode_text.lower()
             
             # Get duration from the Leg level or TransferLeg level
-            duration_elem = leg_elem.xpath('.//ojp:Duration', namespaces=cls.NAMESPACES)
-            if not duration_elem:
-                duration_elem = transfer_leg[0].xpath('.//ojp:Duration', namespaces=cls.NAMESPACES)
+            duration_elem = _child(leg_elem, _TAG_DURATION)
+            if duration_elem is None:
+                duration_elem = _child(transfer_leg, _TAG_DURATION)
             
             duration_minutes = None
-            if duration_elem:
-                duration_text = duration_elem[0].text
+            if duration_elem is not None:
+                duration_text = duration_elem.text
                 if duration_text:
                     # Parse ISO 8601 duration (e.g., PT6M, PT1H30M)
                     duration_minutes = cls._parse_iso_duration(duration_text)
             
             return Leg(
                 mode=mode,
-                origin=origin or Location(name="Unknown", probability=None),
-                destination=destination or Location(name="Unknown", probability=None),
+                origin=origin or _UNKNOWN_LOCATION,
+                destination=destination or _UNKNOWN_LOCATION,
                 duration_minutes=duration_minutes
             )
             
-        except Exception:
+        except _PARSE_ERRORS:
             return None
     
     @classmethod
@@ -316,155 +449,151 @@ class OJPParser:
         """Parse a transfer leg (walking, cycling, etc.) that's a direct child of Leg."""
         try:
             # Get origin and destination from LegStart and LegEnd
-            origin_elem = transfer_leg_elem.xpath('./ojp:LegStart', namespaces=cls.NAMESPACES)
-            destination_elem = transfer_leg_elem.xpath('./ojp:LegEnd', namespaces=cls.NAMESPACES)
+            origin_elem = _child(transfer_leg_elem, _TAG_LEG_START)
+            destination_elem = _child(transfer_leg_elem, _TAG_LEG_END)
             
-            origin = cls._parse_transfer_location(origin_elem[0]) if origin_elem else None
-            destination = cls._parse_transfer_location(destination_elem[0]) if destination_elem else None
+            origin = cls._parse_transfer_location(origin_elem) if origin_elem is not None else None
+            destination = cls._parse_transfer_location(destination_elem) if destination_elem is not None else None
             
             # Get transfer type (walk, cycle, etc.)
-            transfer_type_elem = transfer_leg_elem.xpath('./ojp:TransferType', namespaces=cls.NAMESPACES)
+            transfer_type_elem = _child(transfer_leg_elem, _TAG_TRANSFER_TYPE)
             mode = "walking"  # default
-            if transfer_type_elem:
-                mode_text = transfer_type_elem[0].text
+            if transfer_type_elem is not None:
+                mode_text = transfer_type_elem.text
                 if mode_text:
                     mode = mode_text.lower()
             
             # Get duration from the Leg level first, then TransferLeg level
-            duration_elem = leg_elem.xpath('./ojp:Duration', namespaces=cls.NAMESPACES)
-            if not duration_elem:
-                duration_elem = transfer_leg_elem.xpath('./ojp:Duration', namespaces=cls.NAMESPACES)
+            duration_elem = _child(leg_elem, _TAG_DURATION)
+            if duration_elem is None:
+                duration_elem = _child(transfer_leg_elem, _TAG_DURATION)
             
             duration_minutes = None
-            if duration_elem:
-                duration_text = duration_elem[0].text
+            if duration_elem is not None:
+                duration_text = duration_elem.text
                 if duration_text:
                     # Parse ISO 8601 duration (e.g., PT6M, PT1H30M)
                     duration_minutes = cls._parse_iso_duration(duration_text)
             
             return Leg(
                 mode=mode,
-                origin=origin or Location(name="Unknown", probability=None),
-                destination=destination or Location(name="Unknown", probability=None),
+                origin=origin or _UNKNOWN_LOCATION,
+                destination=destination or _UNKNOWN_LOCATION,
                 duration_minutes=duration_minutes
             )
             
-        except Exception:
+        except _PARSE_ERRORS:
             return None
     
     @classmethod
     def _parse_transfer_location(cls, location_elem) -> Location:
         """Parse a location from a LegStart or LegEnd element in TransferLeg."""
+        # Get location name from Name/Text or n/Text (both formats exist in the XML)
+        name_elem = _XP_NAME_TEXT(location_elem)
+        if not name_elem:
+            name_elem = _XP_N_TEXT(location_elem)
+        
+        name = name_elem[0].text if name_elem else None
+        
+        # Get stop point reference for ID
+        ref_elem = _child(location_elem, _TAG_STOP_POINT_REF)
+        location_id = ref_elem.text if ref_elem is not None else None
+        
+        return Location.model_construct(name=_interned(name) or "Unknown", id=_interned(location_id))
+
+    @classmethod
+    def _parse_service_time(cls, service_elem) -> Optional[datetime]:
+        """Parse a ServiceDeparture/ServiceArrival time, preferring the estimated over the timetabled one."""
+        if service_elem is None:
+            return None
+        time_elem = _child(service_elem, _TAG_ESTIMATED_TIME)
+        if time_elem is None:
+            time_elem = _child(service_elem, _TAG_TIMETABLED_TIME)
+        if time_elem is None:
+            return None
+        return cls._parse_time(time_elem.text)
+
+    @classmethod
+    def _parse_time(cls, time_text: Optional[str]) -> Optional[datetime]:
+        """Parse an OJP timestamp, using the fast ISO 8601 parser and dateutil only as fallback."""
+        if not time_text:
+            return None
         try:
-            # Get location name from Name/Text or n/Text (both formats exist in the XML)
-            name_elem = location_elem.xpath('.//ojp:Name/ojp:Text', namespaces=cls.NAMESPACES)
-            if not name_elem:
-                name_elem = location_elem.xpath('.//ojp:n/ojp:Text', namespaces=cls.NAMESPACES)
-            
-            name = name_elem[0].text if name_elem else "Unknown"
-            
-            # Get stop point reference for ID
-            ref_elem = location_elem.xpath('.//siri:StopPointRef', namespaces=cls.NAMESPACES)
-            location_id = ref_elem[0].text if ref_elem else None
-            
-            return Location(name=name, id=location_id, probability=None)
-            
-        except Exception:
-            return Location(name="Unknown", probability=None)
+            return datetime.fromisoformat(time_text)
+        except ValueError:
+            pass
+        try:
+            return date_parser.parse(time_text)
+        except (ValueError, OverflowError):
+            return None
 
     @classmethod
     def _parse_iso_duration(cls, duration_text: str) -> Optional[int]:
-        """Parse ISO 8601 duration to minutes."""
-        try:
-            # Simple parsing for PT format (e.g., PT15M, PT1H30M, PT6M)
-            if not duration_text.startswith('PT'):
-                return None
-            
-            duration_text = duration_text[2:]  # Remove 'PT'
-            minutes = 0
-            
-            # Parse hours
-            if 'H' in duration_text:
-                parts = duration_text.split('H')
-                hours = int(parts[0])
-                minutes += hours * 60
-                duration_text = parts[1] if len(parts) > 1 else ''
-            
-            # Parse minutes
-            if 'M' in duration_text:
-                minutes_part = duration_text.replace('M', '')
-                if minutes_part:
-                    minutes += int(minutes_part)
-            
-            return minutes
-            
-        except (ValueError, IndexError):
+        """Parse an ISO 8601 time duration (e.g. PT15M, PT1H30M, PT3M30S) to whole minutes."""
+        match = _ISO_DURATION_RE.fullmatch(duration_text)
+        if not match:
             return None
+        hours, minutes = match.group(1, 2)
+        return int(hours or 0) * 60 + int(minutes or 0)
     
     @classmethod
     def _parse_leg_board_alight(cls, location_elem) -> Location:
         """Parse a location from a LegBoard or LegAlight element."""
-        try:
-            # Get location name from StopPointName
-            name_elem = location_elem.xpath('.//ojp:StopPointName/ojp:Text', namespaces=cls.NAMESPACES)
-            name = name_elem[0].text if name_elem else "Unknown"
-            
-            # Get stop point reference for ID
-            ref_elem = location_elem.xpath('.//siri:StopPointRef', namespaces=cls.NAMESPACES)
-            location_id = ref_elem[0].text if ref_elem else None
-            
-            return Location(name=name, id=location_id, probability=None)
-            
-        except Exception:
-            return Location(name="Unknown", probability=None)
+        # Get location name from StopPointName
+        name_elem = _XP_STOP_POINT_NAME_TEXT(location_elem)
+        name = name_elem[0].text if name_elem else None
+        
+        # Get stop point reference for ID
+        ref_elem = _child(location_elem, _TAG_STOP_POINT_REF)
+        location_id = ref_elem.text if ref_elem is not None else None
+        
+        return Location.model_construct(name=_interned(name) or "Unknown", id=_interned(location_id))
 
     @classmethod
     def _parse_leg_location(cls, location_elem) -> Location:
         """Parse a location from a leg element."""
         try:
             # Get location name
-            name_elem = location_elem.xpath('.//ojp:LocationName/ojp:Text', namespaces=cls.NAMESPACES)
-            name = name_elem[0].text if name_elem else "Unknown"
+            name_elem = _XP_LOCATION_NAME_TEXT(location_elem)
+            name = name_elem[0].text if name_elem else None
             
             # Get coordinates
             coordinates = None
-            coord_elem = location_elem.xpath('.//ojp:GeoPosition', namespaces=cls.NAMESPACES)
-            if coord_elem:
-                lon_elem = coord_elem[0].xpath('.//ojp:Longitude', namespaces=cls.NAMESPACES)
-                lat_elem = coord_elem[0].xpath('.//ojp:Latitude', namespaces=cls.NAMESPACES)
+            coord_elem = _child(location_elem, _TAG_GEO_POSITION)
+            if coord_elem is not None:
+                lon_elem = _child(coord_elem, _TAG_OJP_LONGITUDE)
+                lat_elem = _child(coord_elem, _TAG_OJP_LATITUDE)
                 
-                if lon_elem and lat_elem:
+                if lon_elem is not None and lat_elem is not None:
                     try:
                         coordinates = Coordinates(
-                            longitude=float(lon_elem[0].text),
-                            latitude=float(lat_elem[0].text)
+                            longitude=float(lon_elem.text),
+                            latitude=float(lat_elem.text)
                         )
                     except (ValueError, TypeError):
                         pass
             
-            return Location(name=name, coordinates=coordinates, probability=None)
+            return Location.model_construct(name=name or "Unknown", coordinates=coordinates)
             
-        except Exception:
-            return Location(name="Unknown", probability=None)
+        except _PARSE_ERRORS:
+            return _UNKNOWN_LOCATION
 
     @classmethod
     def _parse_place_result(cls, place_elem) -> Optional[Location]:
         """Parse a place result from location information response."""
         try:
             # Navigate to the Place element
-            place = place_elem.xpath('./ojp:Place', namespaces=cls.NAMESPACES)
-            if not place:
+            place = _child(place_elem, _TAG_PLACE)
+            if place is None:
                 return None
             
-            place = place[0]
-            
             # Get location name from Name/Text
-            name_elem = place.xpath('./ojp:Name/ojp:Text', namespaces=cls.NAMESPACES)
+            name_elem = _XP_NAME_TEXT(place)
             name = name_elem[0].text if name_elem else None
             
             # Try to get name from StopPlace/StopPlaceName if Name is not available
             if not name:
-                stop_name_elem = place.xpath('./ojp:StopPlace/ojp:StopPlaceName/ojp:Text', namespaces=cls.NAMESPACES)
+                stop_name_elem = _XP_STOP_PLACE_STOP_PLACE_NAME_TEXT(place)
                 name = stop_name_elem[0].text if stop_name_elem else None
             
             if not name:
@@ -472,42 +601,46 @@ class OJPParser:
             
             # Get coordinates from GeoPosition
             coordinates = None
-            coord_elem = place.xpath('./ojp:GeoPosition', namespaces=cls.NAMESPACES)
-            if coord_elem:
-                lon_elem = coord_elem[0].xpath('./siri:Longitude', namespaces=cls.NAMESPACES)
-                lat_elem = coord_elem[0].xpath('./siri:Latitude', namespaces=cls.NAMESPACES)
+            coord_elem = _child(place, _TAG_GEO_POSITION)
+            if coord_elem is not None:
+                lon_elem = _child(coord_elem, _TAG_SIRI_LONGITUDE)
+                lat_elem = _child(coord_elem, _TAG_SIRI_LATITUDE)
                 
-                if lon_elem and lat_elem:
+                if lon_elem is not None and lat_elem is not None:
                     try:
                         coordinates = Coordinates(
-                            longitude=float(lon_elem[0].text),
-                            latitude=float(lat_elem[0].text)
+                            longitude=float(lon_elem.text),
+                            latitude=float(lat_elem.text)
                         )
                     except (ValueError, TypeError):
                         pass
             
             # Get location ID from StopPlaceRef
             location_id = None
-            id_elem = place.xpath('./ojp:StopPlace/ojp:StopPlaceRef', namespaces=cls.NAMESPACES)
+            id_elem = _XP_STOP_PLACE_STOP_PLACE_REF(place)
             if id_elem:
                 location_id = id_elem[0].text
             
             # Get probability
             probability = None
-            prob_elem = place_elem.xpath('./ojp:Probability', namespaces=cls.NAMESPACES)
-            if prob_elem:
+            prob_elem = _child(place_elem, _TAG_PROBABILITY)
+            if prob_elem is not None:
                 try:
-                    probability = float(prob_elem[0].text)
+                    probability = float(prob_elem.text)
                 except (ValueError, TypeError):
                     pass
             
-            return Location(
-                id=location_id,
-                name=name,
+            # model_construct skips validation, so reject out-of-range scores as the model would
+            if probability is not None and not 0 <= probability <= 1:
+                return None
+            
+            return Location.model_construct(
+                id=_interned(location_id),
+                name=_interned(name),
                 coordinates=coordinates,
                 type="stop",
                 probability=probability
             )
             
-        except Exception:
+        except _PARSE_ERRORS:
             return None
\ No newline at end of file
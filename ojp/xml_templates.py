@@ -1,7 +1,10 @@
 """XML templates for OJP requests."""
 
 from datetime import datetime, UTC
-from typing import Optional
+from typing import AbstractSet, Optional
+from xml.sax.saxutils import escape
+
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 
 def get_trip_request_xml(
@@ -11,15 +14,26 @@ def get_trip_request_xml(
     destination_stop_point_ref: str,
     max_results: int = 10,
     departure_time: Optional[datetime] = None,
-    transport_modes: Optional[list] = None,
+    transport_modes: Optional[AbstractSet[str]] = None,
     requestor_ref: str = "MCP_OJP_Client_prod"
-) -> str:
-    """Generate XML for trip request."""
+) -> bytes:
+    """Generate UTF-8 encoded XML for trip request."""
+    request_timestamp = datetime.now(UTC).strftime(_TIMESTAMP_FORMAT)
+    
     if departure_time is None:
-        departure_time = datetime.now(UTC)
+        timestamp = request_timestamp
+    else:
+        # The Z suffix marks UTC: convert aware times, naive ones are taken as UTC already
+        if departure_time.tzinfo is not None:
+            departure_time = departure_time.astimezone(UTC)
+        timestamp = departure_time.strftime(_TIMESTAMP_FORMAT)
     
-    timestamp = departure_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-    request_timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Escape caller-supplied text so names like "Bahnhof <Nord> & Co" stay well-formed XML
+    origin = escape(origin)
+    destination = escape(destination)
+    origin_stop_point_ref = escape(origin_stop_point_ref)
+    destination_stop_point_ref = escape(destination_stop_point_ref)
+    requestor_ref = escape(requestor_ref)
     
     # Generate mode filters based on transport_modes
     mode_filters = ""
@@ -27,7 +41,7 @@ def get_trip_request_xml(
         # Map transport modes to OJP modes and determine what to exclude
         # For public_transport, we want to include all PT modes (don't exclude anything)
         # For specific modes, we might want to include only those
-        if transport_modes == ["public_transport"] or "public_transport" in transport_modes:
+        if "public_transport" in transport_modes:
             # Don't add any exclusion filters for public transport
             mode_filters = ""
         else:
@@ -68,14 +82,18 @@ def get_trip_request_xml(
 			</OJPTripRequest>
 		</siri:ServiceRequest>
 	</OJPRequest>
-</OJP>"""
+</OJP>""".encode("utf-8")
 
 def get_location_request_xml(
     query: str,
     requestor_ref: str = "MCP_OJP_Client_prod"
-) -> str:
-    """Generate XML for location information request."""
-    request_timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+) -> bytes:
+    """Generate UTF-8 encoded XML for location information request."""
+    request_timestamp = datetime.now(UTC).strftime(_TIMESTAMP_FORMAT)
+    
+    # Escape caller-supplied text so the request stays well-formed XML
+    query = escape(query)
+    requestor_ref = escape(requestor_ref)
     
     return f"""<?xml version="1.0" encoding="UTF-8"?>
 <OJP xmlns="http://www.vdv.de/ojp" xmlns:siri="http://www.siri.org.uk/siri" version="2.0" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://www.vdv.de/ojp ../../../../Downloads/OJP-changes_for_v1.1%20(1)/OJP-changes_for_v1.1/OJP.xsd">
@@ -96,4 +114,4 @@ def get_location_request_xml(
             </OJPLocationInformationRequest>
         </siri:ServiceRequest>
     </OJPRequest>
-</OJP>"""
\ No newline at end of file
+</OJP>""".encode("utf-8")
\ No newline at end of file
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Offline checks for the OJP client's response cache, its keys and single-flight requests."""
+
+import asyncio
+import sys
+import os
+from datetime import datetime, UTC
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from cachetools import TTLCache
+
+from ojp.client import OJPClient
+from ojp.models import TripRequestParams
+
+
+SAMPLE_RESPONSE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_response.xml")
+
+FAILED_STATUS_RESPONSE = b"""<?xml version="1.0" encoding="utf-8"?>
+<OJP xmlns="http://www.vdv.de/ojp" xmlns:siri="http://www.siri.org.uk/siri" version="2.0">
+  <OJPResponse>
+    <siri:ServiceDelivery>
+      <OJPTripDelivery>
+        <siri:Status>false</siri:Status>
+        <siri:ErrorCondition>
+          <siri:OtherError/>
+          <siri:Description>TRIP_NOTRIPFOUND</siri:Description>
+        </siri:ErrorCondition>
+      </OJPTripDelivery>
+    </siri:ServiceDelivery>
+  </OJPResponse>
+</OJP>"""
+
+
+class FakeClock:
+    """Manually advanced timer for TTLCache."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_client(responses, clock=None):
+    """Build an OJPClient whose POSTs are answered in turn from responses, recording each request."""
+    posts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        posts.append(request)
+        # Yield so concurrent callers overlap with the request in flight
+        await asyncio.sleep(0.01)
+        status_code, body = responses[min(len(posts), len(responses)) - 1]
+        return httpx.Response(status_code, content=body)
+
+    client = OJPClient(api_key="test", endpoint="https://ojp.test/ojp20")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    if clock is not None:
+        client._trip_cache = TTLCache(maxsize=1024, ttl=30, timer=clock)
+    return client, posts
+
+
+def trip_params(**overrides) -> TripRequestParams:
+    """Trip parameters for the sample Zürich Giesshübel -> Zürich HB request."""
+    fields = dict(
+        origin="Zürich Giesshübel",
+        destination="Zürich HB",
+        origin_stop_point_ref="8503091",
+        destination_stop_point_ref="8503000",
+    )
+    fields.update(overrides)
+    return TripRequestParams(**fields)
+
+
+def sample_response() -> bytes:
+    with open(SAMPLE_RESPONSE, "rb") as f:
+        return f.read()
+
+
+def test_concurrent_identical_trip_requests_send_one_post():
+    """Identical concurrent trip requests share one in-flight HTTP call."""
+    async def run():
+        client, posts = make_client([(200, sample_response())])
+        responses = await asyncio.gather(*(client.trip_request(trip_params()) for _ in range(10)))
+        await client.aclose()
+        return responses, posts
+
+    responses, posts = asyncio.run(run())
+    assert len(posts) == 1
+    assert all(response.success for response in responses)
+    assert all(response is responses[0] for response in responses)
+
+
+def test_failed_responses_are_not_cached():
+    """HTTP errors and OJP error statuses are returned but not cached."""
+    async def run():
+        client, posts = make_client([
+            (500, b"Internal Server Error"),
+            (200, FAILED_STATUS_RESPONSE),
+            (200, sample_response()),
+        ])
+        http_error = await client.trip_request(trip_params())
+        service_error = await client.trip_request(trip_params())
+        success = await client.trip_request(trip_params())
+        cached = await client.trip_request(trip_params())
+        await client.aclose()
+        return http_error, service_error, success, cached, posts
+
+    http_error, service_error, success, cached, posts = asyncio.run(run())
+    assert not http_error.success
+    assert not service_error.success
+    assert service_error.error_message == "OJP service error: TRIP_NOTRIPFOUND"
+    assert success.success
+    assert cached is success
+    assert len(posts) == 3
+
+
+def test_cached_trip_expires_after_ttl():
+    """A cached trip is reused within the TTL and fetched again once it expires."""
+    async def run():
+        clock = FakeClock()
+        client, posts = make_client([(200, sample_response())], clock)
+        first = await client.trip_request(trip_params())
+        clock.now = 29
+        within_ttl = await client.trip_request(trip_params())
+        clock.now = 31
+        after_ttl = await client.trip_request(trip_params())
+        await client.aclose()
+        return first, within_ttl, after_ttl, posts
+
+    first, within_ttl, after_ttl, posts = asyncio.run(run())
+    assert within_ttl is first
+    assert after_ttl is not first
+    assert after_ttl.success
+    assert len(posts) == 2
+
+
+def test_trip_cache_key_ignores_seconds():
+    """Requests differing only in the seconds of their departure time share a cache entry."""
+    async def run():
+        client, posts = make_client([(200, sample_response())])
+        first = await client.trip_request(trip_params(departure_time=datetime(2025, 7, 30, 8, 0, 5, tzinfo=UTC)))
+        second = await client.trip_request(trip_params(departure_time=datetime(2025, 7, 30, 8, 0, 45, tzinfo=UTC)))
+        await client.aclose()
+        return first, second, posts
+
+    first, second, posts = asyncio.run(run())
+    assert second is first
+    assert len(posts) == 1
+
+
+def test_trip_cache_key_separates_results_and_modes():
+    """Requests differing in max_results or transport modes do not share a cache entry."""
+    async def run():
+        client, posts = make_client([(200, sample_response())])
+        await client.trip_request(trip_params())
+        await client.trip_request(trip_params(max_results=3))
+        await client.trip_request(trip_params(transport_modes=frozenset({"public_transport", "walking"})))
+        # The same modes given in another order are the same frozenset, so this one is a hit
+        await client.trip_request(trip_params(transport_modes=frozenset(["walking", "public_transport"])))
+        await client.trip_request(trip_params(departure_time=datetime(2025, 7, 30, 8, 1, tzinfo=UTC)))
+        await client.aclose()
+        return posts
+
+    posts = asyncio.run(run())
+    assert len(posts) == 4
+
+
+def main():
+    """Run tests."""
+    print("OJP Client Cache Tests")
+    print("======================")
+
+    for test in (
+        test_concurrent_identical_trip_requests_send_one_post,
+        test_failed_responses_are_not_cached,
+        test_cached_trip_expires_after_ttl,
+        test_trip_cache_key_ignores_seconds,
+        test_trip_cache_key_separates_results_and_modes,
+    ):
+        test()
+        print(f"  ok - {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Offline checks for how the OJP parsers handle a delivery's status and error condition."""
+
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ojp.parsers import OJPParser
+
+
+LOCATION_RESPONSE = """<?xml version="1.0" encoding="utf-8"?>
+<OJP xmlns="http://www.vdv.de/ojp" xmlns:siri="http://www.siri.org.uk/siri" version="2.0">
+  <OJPResponse>
+    <siri:ServiceDelivery>
+      <OJPLocationInformationDelivery>
+        {delivery}
+      </OJPLocationInformationDelivery>
+    </siri:ServiceDelivery>
+  </OJPResponse>
+</OJP>"""
+
+PLACE_RESULT = """<PlaceResult>
+          <Place>
+            <StopPlace><StopPlaceRef>8503000</StopPlaceRef></StopPlace>
+            <Name><Text xml:lang="de">Zürich HB</Text></Name>
+          </Place>
+          <Probability>0.9</Probability>
+        </PlaceResult>"""
+
+TRIP_RESPONSE = """<?xml version="1.0" encoding="utf-8"?>
+<OJP xmlns="http://www.vdv.de/ojp" xmlns:siri="http://www.siri.org.uk/siri" version="2.0">
+  <OJPResponse>
+    <siri:ServiceDelivery>
+      <OJPTripDelivery>
+        {delivery}
+      </OJPTripDelivery>
+    </siri:ServiceDelivery>
+  </OJPResponse>
+</OJP>"""
+
+TRIP_RESULT = """<TripResult>
+          <Trip>
+            <Leg>
+              <TimedLeg>
+                <LegBoard>
+                  <siri:StopPointRef>8503091</siri:StopPointRef>
+                  <StopPointName><Text xml:lang="de">Zürich Giesshübel</Text></StopPointName>
+                  <ServiceDeparture><TimetabledTime>2025-07-30T06:00:00Z</TimetabledTime></ServiceDeparture>
+                </LegBoard>
+                <LegAlight>
+                  <siri:StopPointRef>8503000</siri:StopPointRef>
+                  <StopPointName><Text xml:lang="de">Zürich HB</Text></StopPointName>
+                  <ServiceArrival><TimetabledTime>2025-07-30T06:08:00Z</TimetabledTime></ServiceArrival>
+                </LegAlight>
+                <Service>
+                  <Mode><PtMode>rail</PtMode></Mode>
+                  <PublishedServiceName><Text xml:lang="de">S4</Text></PublishedServiceName>
+                </Service>
+              </TimedLeg>
+            </Leg>
+          </Trip>
+        </TripResult>"""
+
+
+def test_false_status_with_description():
+    """A failed delivery reports the server's error description."""
+    response = OJPParser.parse_location_response(LOCATION_RESPONSE.format(delivery="""
+        <siri:Status>false</siri:Status>
+        <siri:ErrorCondition>
+          <siri:OtherError/>
+          <siri:Description>LOCATION_NORESULTS</siri:Description>
+        </siri:ErrorCondition>"""))
+    assert not response.success
+    assert response.error_message == "OJP service error: LOCATION_NORESULTS"
+    assert not response.locations
+
+
+def test_false_status_without_condition():
+    """A failed delivery without an error condition still fails."""
+    response = OJPParser.parse_location_response(LOCATION_RESPONSE.format(delivery="""
+        <siri:Status>false</siri:Status>"""))
+    assert not response.success
+    assert response.error_message == "OJP service error: request failed without an error description"
+
+
+def test_true_status_with_condition_keeps_results():
+    """An error condition under a successful status is a warning; results are kept."""
+    response = OJPParser.parse_location_response(LOCATION_RESPONSE.format(delivery=f"""
+        <siri:Status>true</siri:Status>
+        <siri:ErrorCondition>
+          <siri:OtherError/>
+          <siri:Description>LOCATION_SOME_WARNING</siri:Description>
+        </siri:ErrorCondition>
+        {PLACE_RESULT}"""))
+    assert response.success
+    assert [location.name for location in response.locations] == ["Zürich HB"]
+    assert response.locations[0].id == "8503000"
+
+
+def test_trip_false_status_with_description():
+    """A failed trip delivery such as TRIP_NOTRIPFOUND is reported as an error."""
+    response = OJPParser.parse_trip_response(TRIP_RESPONSE.format(delivery="""
+        <siri:Status>false</siri:Status>
+        <siri:ErrorCondition>
+          <siri:OtherError/>
+          <siri:Description>TRIP_NOTRIPFOUND</siri:Description>
+        </siri:ErrorCondition>"""))
+    assert not response.success
+    assert response.error_message == "OJP service error: TRIP_NOTRIPFOUND"
+    assert not response.trips
+
+
+def test_trip_false_status_without_condition():
+    """A failed trip delivery without an error condition still fails."""
+    response = OJPParser.parse_trip_response(TRIP_RESPONSE.format(delivery="""
+        <siri:Status>false</siri:Status>"""))
+    assert not response.success
+    assert response.error_message == "OJP service error: request failed without an error description"
+
+
+def test_trip_true_status_with_condition_keeps_results():
+    """An error condition under a successful trip status is a warning; trips are kept."""
+    response = OJPParser.parse_trip_response(TRIP_RESPONSE.format(delivery=f"""
+        <siri:Status>true</siri:Status>
+        <siri:ErrorCondition>
+          <siri:OtherError/>
+          <siri:Description>TRIP_SOME_WARNING</siri:Description>
+        </siri:ErrorCondition>
+        {TRIP_RESULT}"""))
+    assert response.success
+    assert len(response.trips) == 1
+    trip = response.trips[0]
+    assert trip.total_duration_minutes == 8
+    assert trip.legs[0].line_name == "S4"
+    assert trip.legs[0].destination.name == "Zürich HB"
+
+
+def main():
+    """Run tests."""
+    print("OJP Parser Status Tests")
+    print("=======================")
+    
+    for test in (
+        test_false_status_with_description,
+        test_false_status_without_condition,
+        test_true_status_with_condition_keeps_results,
+        test_trip_false_status_with_description,
+        test_trip_false_status_without_condition,
+        test_trip_true_status_with_condition_keeps_results,
+    ):
+        test()
+        print(f"  ok - {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()